@@ -6,22 +6,55 @@ This server provides tools to fetch weather forecasts from the UK Met Office Dat
 including hourly, 3-hourly, and daily forecasts for any global location.
 """
 
+import asyncio
+import io
 import os
 import json
-from typing import Dict, Any
+import time
+from typing import Callable, Dict, Any, Optional, Tuple
 from enum import Enum
 from datetime import datetime
+from functools import lru_cache
 import httpx
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict
 from mcp.server.fastmcp import FastMCP
 
-# Initialize the MCP server
-mcp = FastMCP("uk_weather_mcp")
+# orjson is an optional speedup; fall back to the standard library without it
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    _json_loads = json.loads
 
 # Constants
 API_BASE_URL = "https://data.hub.api.metoffice.gov.uk/sitespecific/v0/point"
 CHARACTER_LIMIT = 25000  # Maximum response size in characters
 DEFAULT_TIMEOUT = 30.0  # Seconds
+MARKDOWN_MAX_ENTRIES = 20  # Forecast periods shown in Markdown responses
+MAX_KEEPALIVE_CONNECTIONS = 20
+MAX_CONNECTIONS = 100
+CACHE_TTL = 600.0  # Seconds to reuse a forecast for the same endpoint and location
+CACHE_MAX_ENTRIES = 256
+CACHE_COORD_DECIMALS = 3  # Round coordinates to ~100m when matching cached forecasts
+
+# Shared HTTP client, created on first use so connections are pooled across tool calls
+_client: Optional[httpx.AsyncClient] = None
+
+# Recent API responses keyed by (endpoint, latitude, longitude), oldest first
+_response_cache: Dict[Tuple[str, float, float], Tuple[float, Dict[str, Any]]] = {}
+
+# API requests currently in flight, shared by concurrent callers with the same cache key
+_inflight_requests: Dict[Tuple[str, float, float], "asyncio.Task[Dict[str, Any]]"] = {}
+
+# Initialize the MCP server
+mcp = FastMCP("uk_weather_mcp")
 
 # Weather code descriptions from Met Office
 # Source: https://www.metoffice.gov.uk/services/data/datapoint/code-definitions
@@ -59,6 +92,20 @@ WEATHER_CODES = {
     30: "Thunder",
 }
 
+# Markdown lines for each forecast field, in display order.
+# Each formatter receives the field value and the whole time series entry.
+_MARKDOWN_FIELDS: Tuple[Tuple[str, Callable[[Any, Dict[str, Any]], str]], ...] = (
+    ("screenTemperature", lambda v, entry: f"- **Temperature:** {v}°C"),
+    ("feelsLikeTemperature", lambda v, entry: f"- **Feels Like:** {v}°C"),
+    ("windSpeed10m", lambda v, entry: f"- **Wind:** {v} m/s from {entry.get('windDirectionFrom10m', 'N/A')}°"),
+    ("totalPrecipAmount", lambda v, entry: f"- **Precipitation:** {v} mm"),
+    ("screenRelativeHumidity", lambda v, entry: f"- **Humidity:** {v}%"),
+    ("visibility", lambda v, entry: f"- **Visibility:** {v} m"),
+    ("mslp", lambda v, entry: f"- **Pressure:** {v} Pa"),
+    ("uvIndex", lambda v, entry: f"- **UV Index:** {v}"),
+    ("significantWeatherCode", lambda v, entry: f"- **Weather:** {WEATHER_CODES.get(v, 'Unknown')} (code {v})"),
+)
+
 # Get API key from environment
 API_KEY = os.getenv("MET_OFFICE_API_KEY", "")
 
@@ -95,26 +142,51 @@ class WeatherForecastInput(BaseModel):
         description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
     )
 
-    @field_validator('latitude')
-    @classmethod
-    def validate_latitude(cls, v: float) -> float:
-        if not -90.0 <= v <= 90.0:
-            raise ValueError("Latitude must be between -90 and 90 degrees")
-        return v
 
-    @field_validator('longitude')
-    @classmethod
-    def validate_longitude(cls, v: float) -> float:
-        if not -180.0 <= v <= 180.0:
-            raise ValueError("Longitude must be between -180 and 180 degrees")
-        return v
+# Shared utility functions
+def _get_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client, creating it on first use.
+
+    Reusing one client keeps TLS connections to the Met Office API alive
+    between tool calls instead of paying for a new handshake each time.
+
+    Returns:
+        httpx.AsyncClient: Client configured for the Met Office DataHub API
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            headers={
+                "accept": "application/json",
+                "apikey": API_KEY
+            },
+            http2=True,
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=MAX_CONNECTIONS
+            )
+        )
+    return _client
+
+
+async def _close_client() -> None:
+    """Close the shared HTTP client if one has been created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
 
-# Shared utility functions
 async def _make_api_request(endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Reusable function for all Met Office API calls.
 
+    Responses are cached for CACHE_TTL seconds per endpoint and location, so the
+    returned dict may be shared between callers and must not be modified.
+
     Args:
         endpoint: API endpoint path (e.g., "hourly", "daily")
         params: Query parameters (latitude, longitude)
@@ -129,21 +201,98 @@ async def _make_api_request(endpoint: str, params: Dict[str, Any]) -> Dict[str,
     if not API_KEY:
         raise ValueError("MET_OFFICE_API_KEY environment variable is not set")
 
-    url = f"{API_BASE_URL}/{endpoint}"
-    headers = {
-        "accept": "application/json",
-        "apikey": API_KEY
-    }
+    cache_key = (
+        endpoint,
+        round(params["latitude"], CACHE_COORD_DECIMALS),
+        round(params["longitude"], CACHE_COORD_DECIMALS)
+    )
+    cached = _response_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < CACHE_TTL:
+        return cached[1]
+
+    # Join an identical request that is already in flight rather than sending another
+    task = _inflight_requests.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_and_cache(endpoint, params, cache_key))
+        _inflight_requests[cache_key] = task
+
+        def _on_done(done: "asyncio.Task[Dict[str, Any]]") -> None:
+            _inflight_requests.pop(cache_key, None)
+            # Retrieve the outcome so a failure no caller is left waiting on
+            # isn't logged as "Task exception was never retrieved"
+            if not done.cancelled():
+                done.exception()
+
+        task.add_done_callback(_on_done)
+
+    # Shield the shared request so one caller being cancelled doesn't cancel it for the others
+    return await asyncio.shield(task)
+
+
+async def _fetch_and_cache(
+    endpoint: str,
+    params: Dict[str, Any],
+    cache_key: Tuple[str, float, float]
+) -> Dict[str, Any]:
+    """
+    Fetch a response from the Met Office API and store it in the response cache.
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            url,
-            params=params,
-            headers=headers,
-            timeout=DEFAULT_TIMEOUT
-        )
-        response.raise_for_status()
-        return response.json()
+    Args:
+        endpoint: API endpoint path (e.g., "hourly", "daily")
+        params: Query parameters (latitude, longitude)
+        cache_key: Key to store the parsed response under
+
+    Returns:
+        dict: Parsed JSON response from the API
+    """
+    response = await _get_client().get(f"/{endpoint}", params=params)
+    response.raise_for_status()
+    data = _json_loads(response.content)
+
+    # Re-insert so the entry moves to the end, then evict the oldest if full
+    _response_cache.pop(cache_key, None)
+    if len(_response_cache) >= CACHE_MAX_ENTRIES:
+        del _response_cache[next(iter(_response_cache))]
+    _response_cache[cache_key] = (time.monotonic(), data)
+    return data
+
+
+def _handle_value_error(e: Exception) -> str:
+    """Format a ValueError, such as a missing API key, as an error message."""
+    return f"Error: {str(e)}"
+
+
+def _handle_http_status_error(e: httpx.HTTPStatusError) -> str:
+    """Format an HTTP error response as an error message with guidance for its status code."""
+    status = e.response.status_code
+    if status == 401:
+        return "Error: API key invalid or missing. Please check the MET_OFFICE_API_KEY environment variable is set correctly."
+    elif status == 404:
+        return "Error: Weather data not available for this location. The coordinates may be invalid or outside the service area."
+    elif status == 429:
+        return "Error: Rate limit exceeded. Please wait a few moments before making more requests."
+    elif status == 400:
+        return "Error: Invalid request parameters. Please check that latitude and longitude are valid decimal degrees."
+    return f"Error: API request failed with status {status}. Please try again later."
+
+
+def _handle_timeout_error(e: Exception) -> str:
+    """Format a request timeout as an error message."""
+    return "Error: Request timed out. The Met Office API may be experiencing issues. Please try again."
+
+
+def _handle_connect_error(e: Exception) -> str:
+    """Format a connection failure as an error message."""
+    return "Error: Could not connect to Met Office API. Please check your internet connection."
+
+
+# Error message builders keyed by exception type; each handler receives an instance of its key
+_ERROR_HANDLERS: Dict[type, Callable[[Any], str]] = {
+    ValueError: _handle_value_error,
+    httpx.HTTPStatusError: _handle_http_status_error,
+    httpx.TimeoutException: _handle_timeout_error,
+    httpx.ConnectError: _handle_connect_error,
+}
 
 
 def _handle_api_error(e: Exception) -> str:
@@ -159,26 +308,16 @@ def _handle_api_error(e: Exception) -> str:
     Returns:
         str: User-friendly error message with suggested actions
     """
-    if isinstance(e, ValueError):
-        return f"Error: {str(e)}"
-    elif isinstance(e, httpx.HTTPStatusError):
-        status = e.response.status_code
-        if status == 401:
-            return "Error: API key invalid or missing. Please check the MET_OFFICE_API_KEY environment variable is set correctly."
-        elif status == 404:
-            return "Error: Weather data not available for this location. The coordinates may be invalid or outside the service area."
-        elif status == 429:
-            return "Error: Rate limit exceeded. Please wait a few moments before making more requests."
-        elif status == 400:
-            return "Error: Invalid request parameters. Please check that latitude and longitude are valid decimal degrees."
-        return f"Error: API request failed with status {status}. Please try again later."
-    elif isinstance(e, httpx.TimeoutException):
-        return "Error: Request timed out. The Met Office API may be experiencing issues. Please try again."
-    elif isinstance(e, httpx.ConnectError):
-        return "Error: Could not connect to Met Office API. Please check your internet connection."
+    # Walk the MRO so exact types hit on the first lookup and subclasses
+    # (e.g. httpx.ReadTimeout, json.JSONDecodeError) find their base handler
+    for exc_type in type(e).__mro__:
+        handler = _ERROR_HANDLERS.get(exc_type)
+        if handler is not None:
+            return handler(e)
     return f"Error: Unexpected error occurred: {type(e).__name__}. Please try again."
 
 
+@lru_cache(maxsize=4096)
 def _format_timestamp(timestamp_str: str) -> str:
     """
     Convert ISO 8601 timestamp to human-readable format.
@@ -189,6 +328,11 @@ def _format_timestamp(timestamp_str: str) -> str:
     Returns:
         str: Human-readable timestamp (e.g., "2024-01-15 14:00 UTC")
     """
+    # Met Office timestamps are UTC in the fixed form "YYYY-MM-DDTHH:MMZ",
+    # so the common case is a plain slice with no datetime parsing
+    if len(timestamp_str) >= 17 and timestamp_str[10] == 'T' and timestamp_str.endswith('Z'):
+        return f"{timestamp_str[:10]} {timestamp_str[11:16]} UTC"
+
     try:
         dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
         return dt.strftime("%Y-%m-%d %H:%M UTC")
@@ -196,18 +340,24 @@ def _format_timestamp(timestamp_str: str) -> str:
         return timestamp_str
 
 
-def _format_weather_markdown(data: Dict[str, Any], forecast_type: str) -> str:
+def _format_weather_markdown(
+    data: Dict[str, Any],
+    forecast_type: str,
+    max_entries: int = MARKDOWN_MAX_ENTRIES
+) -> str:
     """
     Format weather forecast data as Markdown for human readability.
 
     Args:
         data: Weather forecast data from API
         forecast_type: Type of forecast (hourly, 3-hourly, daily)
+        max_entries: Maximum number of forecast periods to include
 
     Returns:
         str: Markdown-formatted weather forecast
     """
-    lines = []
+    buf = io.StringIO()
+    write = buf.write
 
     # Header
     features = data.get("features", [])
@@ -220,9 +370,9 @@ def _format_weather_markdown(data: Dict[str, Any], forecast_type: str) -> str:
 
     if len(coords) >= 2:
         lon, lat = coords[0], coords[1]
-        lines.append(f"# Weather Forecast ({forecast_type})")
-        lines.append(f"**Location:** {lat:.4f}°N, {lon:.4f}°E")
-        lines.append("")
+        write(f"# Weather Forecast ({forecast_type})\n")
+        write(f"**Location:** {lat:.4f}°N, {lon:.4f}°E\n")
+        write("\n")
 
     # Time series data
     properties = feature.get("properties", {})
@@ -231,118 +381,130 @@ def _format_weather_markdown(data: Dict[str, Any], forecast_type: str) -> str:
     if not time_series:
         return "No forecast data available."
 
-    lines.append(f"**Forecast periods:** {len(time_series)}")
-    lines.append("")
+    write(f"**Forecast periods:** {len(time_series)}\n")
+    write("\n")
 
     # Display forecast entries
-    for i, entry in enumerate(time_series[:20]):  # Limit to first 20 entries
-        time = entry.get("time", "Unknown time")
-        formatted_time = _format_timestamp(time)
-
-        lines.append(f"## {formatted_time}")
-
-        # Screen temperature
-        if "screenTemperature" in entry:
-            temp = entry["screenTemperature"]
-            lines.append(f"- **Temperature:** {temp}°C")
-
-        # Feels like temperature
-        if "feelsLikeTemperature" in entry:
-            feels = entry["feelsLikeTemperature"]
-            lines.append(f"- **Feels Like:** {feels}°C")
-
-        # Wind
-        if "windSpeed10m" in entry:
-            wind_speed = entry["windSpeed10m"]
-            wind_dir = entry.get("windDirectionFrom10m", "N/A")
-            lines.append(f"- **Wind:** {wind_speed} m/s from {wind_dir}°")
-
-        # Precipitation
-        if "totalPrecipAmount" in entry:
-            precip = entry["totalPrecipAmount"]
-            lines.append(f"- **Precipitation:** {precip} mm")
-
-        # Humidity
-        if "screenRelativeHumidity" in entry:
-            humidity = entry["screenRelativeHumidity"]
-            lines.append(f"- **Humidity:** {humidity}%")
-
-        # Visibility
-        if "visibility" in entry:
-            visibility = entry["visibility"]
-            lines.append(f"- **Visibility:** {visibility} m")
-
-        # Pressure
-        if "mslp" in entry:
-            pressure = entry["mslp"]
-            lines.append(f"- **Pressure:** {pressure} Pa")
-
-        # UV Index
-        if "uvIndex" in entry:
-            uv = entry["uvIndex"]
-            lines.append(f"- **UV Index:** {uv}")
-
-        # Weather description
-        if "significantWeatherCode" in entry:
-            weather_code = entry["significantWeatherCode"]
-            weather_desc = WEATHER_CODES.get(weather_code, "Unknown")
-            lines.append(f"- **Weather:** {weather_desc} (code {weather_code})")
-
-        lines.append("")
+    for entry in time_series[:max_entries]:
+        entry_time = entry.get("time", "Unknown time")
+        formatted_time = _format_timestamp(entry_time)
+
+        write(f"## {formatted_time}\n")
+
+        for key, formatter in _MARKDOWN_FIELDS:
+            value = entry.get(key)
+            if value is not None:
+                write(formatter(value, entry) + "\n")
+
+        write("\n")
 
     # Add truncation notice if needed
-    if len(time_series) > 20:
-        lines.append(f"*Showing first 20 of {len(time_series)} forecast periods. Use JSON format for complete data.*")
+    if len(time_series) > max_entries:
+        write(f"*Showing first {max_entries} of {len(time_series)} forecast periods. Use JSON format for complete data.*\n")
+
+    return buf.getvalue()
+
+
+def _with_time_series(data: Dict[str, Any], keep_count: int) -> Dict[str, Any]:
+    """
+    Return the forecast data with its time series cut to the first keep_count entries.
+
+    The data is shallow-copied rather than modified, since API responses are shared
+    through the response cache.
+
+    Args:
+        data: Weather forecast data from API
+        keep_count: Maximum number of time series entries to keep
+
+    Returns:
+        dict: Forecast data with at most keep_count time series entries
+    """
+    features = data.get("features", [])
+    if not features:
+        return data
+    feature = features[0]
+    properties = feature.get("properties", {})
+    time_series = properties.get("timeSeries")
+    if time_series is None or len(time_series) <= keep_count:
+        return data
+    return {
+        **data,
+        "features": [
+            {**feature, "properties": {**properties, "timeSeries": time_series[:keep_count]}},
+            *features[1:]
+        ]
+    }
+
+
+def _time_series_length(data: Dict[str, Any]) -> int:
+    """Return the number of time series entries in the forecast data."""
+    features = data.get("features", [])
+    if not features:
+        return 0
+    return len(features[0].get("properties", {}).get("timeSeries", []))
+
+
+def _format_json_within_limit(
+    build: Callable[[int], Any],
+    max_count: int,
+    limit: int = CHARACTER_LIMIT
+) -> str:
+    """
+    Serialize a response as indented JSON, keeping as many time series entries as fit.
+
+    The JSON is kept as UTF-8 bytes until it is known to fit. The byte length
+    is an upper bound on the character count, so the common case needs no
+    decode before the final one. Oversized responses are rebuilt with fewer
+    time series entries rather than cut, so the result is always valid JSON.
+
+    Args:
+        build: Returns the response object holding at most the given number of
+            time series entries per forecast
+        max_count: Number of entries that keeps every time series complete
+        limit: Maximum response size in characters (defaults to CHARACTER_LIMIT)
+
+    Returns:
+        str: JSON-formatted response
+    """
+    raw = _json_dumps(build(max_count))
+    if len(raw) <= limit:
+        return raw.decode()
+
+    # Binary search for the most entries that fit under the limit;
+    # the full series is already known not to fit
+    low, high = 0, max_count - 1
+    truncated_json = None
+    while low < high:
+        keep_count = (low + high + 1) // 2
+        candidate = _json_dumps(build(keep_count))
+        if len(candidate) <= limit:
+            low, truncated_json = keep_count, candidate
+        else:
+            high = keep_count - 1
+    if truncated_json is not None:
+        return truncated_json.decode()
 
-    return "\n".join(lines)
+    # If still too big, return minimal structure
+    return _json_dumps({
+        "error": "Response too large",
+        "message": f"Forecast data exceeds {limit} character limit. Try requesting a shorter time period."
+    }).decode()
 
 
-def _truncate_if_needed(content: str, data: Dict[str, Any], is_json: bool = False) -> str:
+def _format_weather_json(data: Dict[str, Any]) -> str:
     """
-    Check response size and truncate if it exceeds CHARACTER_LIMIT.
+    Format weather forecast data as indented JSON, truncated to fit CHARACTER_LIMIT.
 
     Args:
-        content: Formatted response string
-        data: Original data for truncation reference
-        is_json: Whether the content is JSON format
+        data: Weather forecast data from API
 
     Returns:
-        str: Original or truncated content with truncation notice
+        str: JSON-formatted weather forecast
     """
-    if len(content) <= CHARACTER_LIMIT:
-        return content
-
-    # For JSON, truncate features array to keep it valid JSON
-    if is_json:
-        import json
-        try:
-            parsed = json.loads(content)
-            if "features" in parsed and len(parsed["features"]) > 0:
-                # Reduce time series data
-                feature = parsed["features"][0]
-                if "properties" in feature and "timeSeries" in feature["properties"]:
-                    time_series = feature["properties"]["timeSeries"]
-                    # Keep reducing until under limit
-                    for keep_count in [20, 10, 5, 1]:
-                        feature["properties"]["timeSeries"] = time_series[:keep_count]
-                        truncated_json = json.dumps(parsed, indent=2)
-                        if len(truncated_json) <= CHARACTER_LIMIT:
-                            return truncated_json
-                    # If still too big, return minimal structure
-                    return json.dumps({
-                        "error": "Response too large",
-                        "message": f"Forecast data exceeds {CHARACTER_LIMIT} character limit. Try requesting a shorter time period."
-                    }, indent=2)
-        except json.JSONDecodeError:
-            pass
-
-    # For Markdown, just truncate and add notice
-    truncated = content[:CHARACTER_LIMIT]
-    truncated += "\n\n---\n\n"
-    truncated += f"**Response truncated** (exceeded {CHARACTER_LIMIT} character limit). "
-    truncated += "Try using JSON format with filtering or requesting a shorter forecast period."
-
-    return truncated
+    return _format_json_within_limit(
+        lambda keep_count: _with_time_series(data, keep_count),
+        _time_series_length(data)
+    )
 
 
 # Tool definitions
@@ -383,6 +545,7 @@ async def uk_weather_get_hourly_forecast(params: WeatherForecastInput) -> str:
         JSON format includes:
         - Complete GeoJSON response with all available weather parameters
         - Full 48-hour forecast
+        - Time series shortened if the response would exceed 25,000 characters
         - All metadata and geometry information
 
         Error format:
@@ -418,13 +581,12 @@ async def uk_weather_get_hourly_forecast(params: WeatherForecastInput) -> str:
         )
 
         # Format response based on requested format
-        if params.response_format == ResponseFormat.MARKDOWN:
-            result = _format_weather_markdown(data, "Hourly")
-            return _truncate_if_needed(result, data, is_json=False)
+        if params.response_format is ResponseFormat.MARKDOWN:
+            # Output is bounded by MARKDOWN_MAX_ENTRIES, so no truncation pass is needed
+            return _format_weather_markdown(data, "Hourly")
         else:
             # Machine-readable JSON format
-            result = json.dumps(data, indent=2)
-            return _truncate_if_needed(result, data, is_json=True)
+            return _format_weather_json(data)
 
     except Exception as e:
         return _handle_api_error(e)
@@ -467,6 +629,7 @@ async def uk_weather_get_three_hourly_forecast(params: WeatherForecastInput) ->
         JSON format includes:
         - Complete GeoJSON response with all available weather parameters
         - Full 7-day forecast at 3-hour intervals
+        - Time series shortened if the response would exceed 25,000 characters
         - All metadata and geometry information
 
         Error format:
@@ -502,13 +665,12 @@ async def uk_weather_get_three_hourly_forecast(params: WeatherForecastInput) ->
         )
 
         # Format response based on requested format
-        if params.response_format == ResponseFormat.MARKDOWN:
-            result = _format_weather_markdown(data, "3-Hourly")
-            return _truncate_if_needed(result, data, is_json=False)
+        if params.response_format is ResponseFormat.MARKDOWN:
+            # Output is bounded by MARKDOWN_MAX_ENTRIES, so no truncation pass is needed
+            return _format_weather_markdown(data, "3-Hourly")
         else:
             # Machine-readable JSON format
-            result = json.dumps(data, indent=2)
-            return _truncate_if_needed(result, data, is_json=True)
+            return _format_weather_json(data)
 
     except Exception as e:
         return _handle_api_error(e)
@@ -551,6 +713,7 @@ async def uk_weather_get_daily_forecast(params: WeatherForecastInput) -> str:
         JSON format includes:
         - Complete GeoJSON response with all available daily weather parameters
         - Full 7-day daily forecast
+        - Time series shortened if the response would exceed 25,000 characters
         - All metadata and geometry information
 
         Error format:
@@ -586,18 +749,129 @@ async def uk_weather_get_daily_forecast(params: WeatherForecastInput) -> str:
         )
 
         # Format response based on requested format
-        if params.response_format == ResponseFormat.MARKDOWN:
-            result = _format_weather_markdown(data, "Daily")
-            return _truncate_if_needed(result, data, is_json=False)
+        if params.response_format is ResponseFormat.MARKDOWN:
+            # Output is bounded by MARKDOWN_MAX_ENTRIES, so no truncation pass is needed
+            return _format_weather_markdown(data, "Daily")
         else:
             # Machine-readable JSON format
-            result = json.dumps(data, indent=2)
-            return _truncate_if_needed(result, data, is_json=True)
+            return _format_weather_json(data)
+
+    except Exception as e:
+        return _handle_api_error(e)
+
+
+@mcp.tool(
+    name="uk_weather_get_all_forecasts",
+    annotations={
+        "title": "Get All Weather Forecasts",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": True
+    }
+)
+async def uk_weather_get_all_forecasts(params: WeatherForecastInput) -> str:
+    """
+    Get hourly, 3-hourly and daily weather forecasts for a location in one call.
+
+    This tool fetches all three Met Office forecast types for the same location
+    concurrently, which is faster than calling the individual forecast tools one
+    after another. Useful when both short-term detail and a weekly overview are needed.
+
+    Args:
+        params (WeatherForecastInput): Validated input parameters containing:
+            - latitude (float): Latitude in decimal degrees, -90 to 90 (e.g., 51.5074 for London)
+            - longitude (float): Longitude in decimal degrees, -180 to 180 (e.g., -0.1278 for London)
+            - response_format (ResponseFormat): 'markdown' (default, human-readable) or 'json' (machine-readable)
+
+    Returns:
+        str: Weather forecast data in the requested format
+
+        Markdown format includes:
+        - The hourly, 3-hourly and daily Markdown forecasts, one after another
+        - Each section limited to its first 20 periods (use JSON for complete data)
+
+        JSON format includes:
+        - An object with "hourly", "three-hourly" and "daily" keys, each holding the
+          GeoJSON response for that forecast type
+        - If the response would exceed 25,000 characters, each forecast keeps only
+          as many periods as fit
+
+        Error format:
+        - "Error: <specific error message with resolution guidance>"
+
+    Examples:
+        - Use when: "What's the weather in Bristol today and for the rest of the week?"
+          → params with latitude=51.4545, longitude=-2.5879
+
+        - Don't use when: Only one forecast type is needed (use the specific forecast tool instead)
+
+    Error Handling:
+        - Returns "Error: MET_OFFICE_API_KEY environment variable is not set" if API key missing
+        - Returns "Error: API key invalid or missing" if authentication fails (401)
+        - Returns "Error: Weather data not available for this location" if coordinates invalid (404)
+        - Returns "Error: Rate limit exceeded" if too many requests (429)
+        - Returns "Error: Request timed out" if API is slow or unavailable
+        - Input validation errors handled automatically by Pydantic model
+    """
+    try:
+        query = {
+            "latitude": params.latitude,
+            "longitude": params.longitude
+        }
+
+        # Fetch all forecast types concurrently over the shared connection pool
+        hourly, three_hourly, daily = await asyncio.gather(
+            _make_api_request("hourly", query),
+            _make_api_request("three-hourly", query),
+            _make_api_request("daily", query)
+        )
+
+        # Format response based on requested format
+        if params.response_format is ResponseFormat.MARKDOWN:
+            return "\n---\n\n".join([
+                _format_weather_markdown(hourly, "Hourly"),
+                _format_weather_markdown(three_hourly, "3-Hourly"),
+                _format_weather_markdown(daily, "Daily")
+            ])
+        else:
+            # Machine-readable JSON format, with every forecast capped at the same
+            # number of periods so the combined object fits the limit
+            forecasts = {
+                "hourly": hourly,
+                "three-hourly": three_hourly,
+                "daily": daily
+            }
+            return _format_json_within_limit(
+                lambda keep_count: {
+                    name: _with_time_series(data, keep_count)
+                    for name, data in forecasts.items()
+                },
+                max(_time_series_length(data) for data in forecasts.values())
+            )
 
     except Exception as e:
         return _handle_api_error(e)
 
 
+async def _run_stdio_server() -> None:
+    """
+    Run the MCP server over stdio, closing the shared HTTP client on exit.
+
+    The client lives for the whole process, so it is closed here rather than in a
+    FastMCP lifespan, which other transports enter once per session.
+    """
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        await _close_client()
+
+
 if __name__ == "__main__":
-    # Run the MCP server
-    mcp.run()
+    import importlib.util
+
+    import anyio
+
+    # Run the MCP server, on uvloop's faster event loop when the speedups extra is installed
+    use_uvloop = importlib.util.find_spec("uvloop") is not None
+    anyio.run(_run_stdio_server, backend_options={"use_uvloop": use_uvloop})